@@ -1,13 +1,24 @@
 import os
 from pathlib import Path
-import shelve
-from shelve import Shelf, DbfilenameShelf
+import pickle
 
 data = {'a': 0, 'b': 1, 'c': 'c-string'}
 
-filename = str(Path.home() / "shelf")
-#os.remove(filename + ".db")
-db = DbfilenameShelf(filename, flag='c', protocol=3, writeback=True)
-#db.update(data)
-#db.sync()
-print(f"shelf: {dict(db)}")
+# A single pickle file beats the shelve/dbm layer for small datasets:
+# one read/write instead of multiple dbm page accesses, and protocol 5
+# uses out-of-band buffers for things like numpy arrays.
+path = Path.home() / "shelf.pkl"
+
+def save(d):
+    path.write_bytes(pickle.dumps(d, protocol=5))
+
+def load():
+    return pickle.loads(path.read_bytes()) if path.exists() else {}
+
+#save(data)
+db = load()
+db.update(data)
+save(db)
+print(f"store: {load()}")
+# For concurrent access, swap this for sqlite3 with a single BLOB
+# column and journal_mode=WAL.
@@ -1,9 +1,19 @@
 import builtins
-import json
+import functools
+
+# -- orjson parses JSON considerably faster than the stdlib; fall back
+# -- to the stdlib so the module still imports when it is not installed
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 from numbers import Number
 from pathlib import Path
 import platform
+import re
 import sys
+from types import MappingProxyType
 from typing import (
     ClassVar,
     Mapping,
@@ -11,21 +21,53 @@ from typing import (
     Sequence,
     Union,
 )
+import matplotlib as mpl
+import numpy as np
+
 from qute import QApplication, QObject
+from qute.vendor.Qt import QtCore, QtWidgets
 
 import pyqtconsole.console
 from pyqtconsole import highlighter as hl
 
+# -- Optional linear-time regex engines for the highlight hot path.
+try:
+    import hyperscan as _hyperscan
+except ImportError:
+    _hyperscan = None
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
 
 ColorLike = Union[str, Sequence[Number]]
 
 
+@functools.lru_cache(maxsize=512)
+def _to_rgba_scalar(
+    c: ColorLike,
+    alpha: Optional[Number] = None,
+    ) -> tuple:
+    """
+    Cached conversion for hashable (scalar) color inputs. Theme colors
+    are requested repeatedly with the same handful of strings, so the
+    matplotlib parse only runs once per (color, alpha) pair.
+    """
+    return mpl.colors.to_rgba(c, alpha=alpha)
+
+
 def to_rgba(
     c: ColorLike,
     alpha: Optional[Number] = None,
     ) -> np.ndarray:
 
-    out = mpl.colors.to_rgba(c, alpha=alpha)
+    try:
+        out = _to_rgba_scalar(c, alpha)
+    except TypeError:
+        # Unhashable inputs (lists, arrays) bypass the cache.
+        out = mpl.colors.to_rgba(c, alpha=alpha)
     out = np.array(out) if isinstance(out, tuple) else out
     return out
 
@@ -41,14 +83,44 @@ def to_rgb(
     return out
 
 
+@functools.lru_cache(maxsize=512)
+def _to_RGBA_scalar(
+    c: ColorLike,
+    alpha: Optional[Number] = None,
+    ) -> np.ndarray:
+
+    rgba = _to_rgba_scalar(c, alpha)
+    return np.array([round(v * 255) for v in rgba], dtype=np.uint8)
+
+
 def to_RGBA(
     c: ColorLike,
     alpha: Optional[Number] = None,
     ) -> np.ndarray:
 
+    if isinstance(c, str):
+        # Copy so callers can mutate the result (as they could with the
+        # uncached version) without corrupting the cache entry.
+        return _to_RGBA_scalar(c, alpha).copy()
+
     out = to_rgba(c, alpha)
-    out = (255 * out).astype(np.uint8)
-    return out
+    # Fuse scale/round in place on the float array (which we own) rather
+    # than allocating a float64 temporary via `(255 * out)`.
+    np.multiply(out, 255.0, out=out)
+    np.rint(out, out=out)
+    return out.astype(np.uint8, copy=False)
+
+
+@functools.lru_cache(maxsize=512)
+def _to_RGB_scalar(
+    c: ColorLike,
+    alpha: Optional[Number] = None,
+    ) -> np.ndarray:
+
+    # Go straight to matplotlib's 3-channel converter: no intermediate
+    # rgba arrays, no slicing - just one cached uint8 triple.
+    rgb = mpl.colors.to_rgb(c)
+    return np.array([round(v * 255) for v in rgb], dtype=np.uint8)
 
 
 def to_RGB(
@@ -56,37 +128,59 @@ def to_RGB(
     alpha: Optional[Number] = None,
     ) -> Union[np.ndarray]:
 
+    if isinstance(c, str):
+        # Copy for the same reason as to_RGBA: the cached array must
+        # stay pristine if the caller mutates the result.
+        return _to_RGB_scalar(c, alpha).copy()
+
     out = to_RGBA(c, alpha)[..., 0:3]
     return out
 
 
 
-class Style:
+# -- Appended to the stylesheet on macOS to keep dock titles legible.
+_MAC_FIX = '''
+QDockWidget::title
+{
+    background-color: #31363b;
+    text-align: center;
+    height: 12px;
+}
+'''
 
 
-    def __init__(self):
-        self.path = Path(__file__).parent.parent / 'resources' / 'style'
+@functools.lru_cache(maxsize=None)
+def _load_style(path: Path, is_darwin: bool) -> tuple:
+    """
+    Load and assemble the stylesheet and color table for a style directory.
+
+    The resource files are shipped with the package and never change at
+    runtime, so the result is cached: repeated `Style()` construction does
+    no I/O and no JSON parsing after the first call.
+    """
+    style_sheet = path.joinpath('qstyle.qss').read_text(encoding='utf-8')
+
+    if is_darwin:
+        style_sheet += _MAC_FIX
 
-        # Load 'qstyle.qss'.
-        f = QFile(str(self.path / 'qstyle.qss'))
-        f.open(QFile.ReadOnly | QFile.Text)
-        self._style_sheet = QTextStream(f).readAll()
+    # If theme has a colors.json file, read it. ??
+    colors = _json.loads(path.joinpath('colors.json').read_bytes())
 
-        if platform.system().lower() == 'darwin':
-            mac_fix = '''
-            QDockWidget::title
-            {
-                background-color: #31363b;
-                text-align: center;
-                height: 12px;
-            }
-            '''
-            self._style_sheet += mac_fix
+    return style_sheet, colors
 
-        # If theme has a colors.json file, read it. ??
-        self.colors = {}
-        with open(str(self.path / 'colors.json'), 'r') as f:
-            self.colors = json.load(f)
+
+class Style:
+
+    # Fixed attribute set: skip the per-instance __dict__.
+    __slots__ = ('path', '_style_sheet', 'colors')
+
+
+    def __init__(self):
+        self.path = Path(__file__).parent.parent / 'resources' / 'style'
+        self._style_sheet, self.colors = _load_style(
+            self.path,
+            platform.system().lower() == 'darwin',
+        )
 
 
     @property
@@ -127,44 +221,54 @@ class Application(QObject):
 
     """
 
-    _state: ApplicationState = ApplicationState.NONE
-    
-    #: Wrapped QApplication instance.
-    _qapp: Optional[QApplication] = None
-    
+    # Python-side storage only; Qt's meta-object machinery keeps its own
+    # storage for the QObject base.
+    __slots__ = (
+        '_state',
+        '_qapp',
+        '_qapp_args',
+        '_qapp_exit_status',
+        '_console_resources',
+    )
+
+    _state: ApplicationState
+
+    #: Wrapped QApplication instance, created lazily.
+    _qapp: Optional[QApplication]
+
+    #: Positional arguments forwarded to the QApplication constructor.
+    _qapp_args: tuple
+
     #:
-    _qapp_exit_status: Optional[int] = None
-    
+    _qapp_exit_status: Optional[int]
+
 
     def __new__(cls, *args, **kw):
-        
+
         global _APP
-        
-        if _APP is None:
-            
-            if QApplication.instance() is not None:
-                raise RuntimeError("QApplication instance already exists")
-            
-            try:
-                _APP = self = object.__new__(cls)
-                self._state = ApplicationState.CREATED
-                self._qapp = self._create_qapp(*args, **kw)
-                self._qapp_exit_status = None
-
-            except:
-                _APP = None
-                self._state = ApplicationState.NONE
-                self._qapp = None
-                self._qapp_exit_status = None
-                raise
-            
+
+        # Fast path: the singleton already exists. This is a single
+        # module-global read with no Qt round-trip.
+        if _APP is not None:
             return _APP
-                
-        else:
-            # Restart qapp if necessary.
-            pass
-            
-            
+
+        # Only consult Qt's global registry when we actually need to
+        # construct the singleton.
+        if QApplication.instance() is not None:
+            raise RuntimeError("QApplication instance already exists")
+
+        try:
+            _APP = self = object.__new__(cls)
+            self._state = ApplicationState.CREATED
+            self._qapp = None
+            self._qapp_args = args
+            self._qapp_exit_status = None
+            self._console_resources = None
+
+        except:
+            _APP = None
+            raise
+
         return _APP
 
 
@@ -178,19 +282,39 @@ class Application(QObject):
     
     @classmethod
     def instance(cls) -> Optional["Application"]:
-        return cls._instance
+        return _APP
 
 
-    def _create_qapp(self, *args, **kw) -> Optional[QApplication]:
-        if QApplication.instance() is not None:
-            raise RuntimeError("QApplication instance already exists")
-        self._qapp = QApplication(*args)
-        self._qapp.aboutToQuit.connect(self._qapp.deleteLater)
+    @property
+    def qapp(self) -> QApplication:
+        # The QApplication is constructed lazily on first access rather
+        # than at singleton creation; __new__ already verified that no
+        # foreign QApplication exists.
+        if self._qapp is None:
+            self._qapp = QApplication(*self._qapp_args)
+            self._qapp.aboutToQuit.connect(self._qapp.deleteLater)
         return self._qapp
-    
-    
+
+
+
     def _require_qapp(self):
         pass
+
+
+    def console_resources(self) -> tuple:
+        """
+        Shared console resources - the (formats, stylesheet, builtin
+        overlay) triple - held on the application singleton so that
+        reopening consoles is a straight attribute read rather than a
+        rebuild.
+        """
+        if self._console_resources is None:
+            self._console_resources = (
+                _monokai_highlighting(),
+                _CONSOLE_STYLESHEET,
+                (_builtin_regex(), _builtin_format()),
+            )
+        return self._console_resources
     
 
     def exec(self) -> None:
@@ -202,7 +326,7 @@ class Application(QObject):
             
         
         try:
-            self._qapp.exec()
+            self.qapp.exec()
             error = None
         except Exception as e:
             error = e
@@ -211,37 +335,163 @@ class Application(QObject):
 
 
     def cleanup(self, error: Optional[Exception] = None) -> None:
-        self._app = None
+        self._qapp = None
         self.init_app()
-    
-    
+
+
     @classmethod
     def hard_reset(cls):
-        global _INSTANCE
-        if _INSTANCE is None:
+        global _APP
+        if _APP is None:
             return
-        _INSTANCE._app = None
-        _INSTANCE._owns_app = None
-        _INSTANCE._state = ApplicationState.NONE
+        _APP._qapp = None
+        _APP._state = ApplicationState.NONE
 
 
 
 
-_monokai_highlighting = {
-    'keyword':    hl.format("#F92672"),
-    'operator':   hl.format("#F8F8F2"),
-    'brace':      hl.format("#F8F8F2"),
-    'defclass':   hl.format("#F92672"),
-    'string':     hl.format("#E6DB74"),
-    'string2':    hl.format("#E6DB74"),
-    'comment':    hl.format("#75715E"),
-    'self':       hl.format("#F8F8F2"),
-    'numbers':    hl.format("#AE81FF"),
-    'inprompt':   hl.format("#F8F8F2"),
-    'outprompt':  hl.format("#F8F8F2"),
-}
+# -- dir(builtins) is stable for a given interpreter, so the combined
+# -- highlight pattern can be computed once at import time. Everything
+# -- else the builtin overlay needs (the compiled regex and the single
+# -- hl.format text format) is cached lazily below, leaving zero
+# -- per-instance build work when consoles are reopened.
+_BUILTIN_PATTERN = r'\b(?:' + '|'.join(
+    re.escape(w) for w in dir(builtins)
+) + r')\b'
+
+
+@functools.lru_cache(maxsize=None)
+def _builtin_format():
+    """
+    Build the shared builtin-highlight text format. Constructed lazily
+    (and only once) because hl.format creates a QTextCharFormat, which
+    may require a QApplication to exist.
+    """
+    return hl.format("#66D9EF")
 
 
+@functools.lru_cache(maxsize=None)
+def _builtin_regex() -> QtCore.QRegularExpression:
+    regex = QtCore.QRegularExpression(_BUILTIN_PATTERN)
+    # OptimizeOnFirstUsageOption enables PCRE's JIT in Qt5. Qt6 removed
+    # the flag because optimization became the default behavior.
+    if hasattr(QtCore.QRegularExpression, 'OptimizeOnFirstUsageOption'):
+        regex.setPatternOptions(
+            QtCore.QRegularExpression.OptimizeOnFirstUsageOption
+        )
+    return regex
+
+
+@functools.lru_cache(maxsize=None)
+def _builtin_scanner():
+    """
+    Return a callable mapping block text to a list of (start, length)
+    spans of builtin names, using the fastest engine available:
+    hyperscan (JIT'd DFA), then re2 (linear-time DFA), then Qt's
+    QRegularExpression as the ever-present fallback.
+    """
+    if _hyperscan is not None:
+        db = _hyperscan.Database()
+        db.compile(
+            expressions=[_BUILTIN_PATTERN.encode()],
+            ids=[0],
+            elements=1,
+            flags=[_hyperscan.HS_FLAG_SOM_LEFTMOST | _hyperscan.HS_FLAG_UTF8],
+        )
+
+        def scan(text, _db=db):
+            spans = []
+            # Builtin names are pure ASCII, so byte offsets only drift
+            # on blocks containing non-ASCII text; punt to Qt for those.
+            encoded = text.encode('utf-8')
+            if len(encoded) != len(text):
+                return _qt_scan(text)
+            _db.scan(
+                encoded,
+                match_event_handler=lambda i, s, e, f, ctx: \
+                    spans.append((s, e - s)),
+            )
+            return spans
+
+        return scan
+
+    if _re2 is not None:
+        finditer = _re2.compile(_BUILTIN_PATTERN).finditer
+
+        def scan(text, _finditer=finditer):
+            return [(m.start(), m.end() - m.start()) for m in _finditer(text)]
+
+        return scan
+
+    return _qt_scan
+
+
+def _qt_scan(text) -> list:
+    spans = []
+    matches = _builtin_regex().globalMatch(text)
+    while matches.hasNext():
+        m = matches.next()
+        spans.append((m.capturedStart(), m.capturedLength()))
+    return spans
+
+
+def _install_builtin_highlighting(highlighter) -> None:
+    """
+    Overlay builtin-name highlighting onto a pyqtconsole highlighter.
+
+    pyqtconsole's rule loop is built around the deprecated QRegExp, so
+    rather than appending a rule we wrap highlightBlock and run the
+    combined builtin pattern through the shared scanner, which matches
+    considerably faster in the per-keystroke path.
+    """
+    scan = _builtin_scanner()
+    fmt = _builtin_format()
+    base_highlight = highlighter.highlightBlock
+
+    def highlight_block(text):
+        base_highlight(text)
+        for start, length in scan(text):
+            highlighter.setFormat(start, length, fmt)
+
+    highlighter.highlightBlock = highlight_block
+
+
+@functools.lru_cache(maxsize=None)
+def _monokai_highlighting() -> Mapping:
+    """
+    Monokai highlight formats, built on first console construction and
+    shared between consoles. The mapping is wrapped in a read-only proxy
+    so the shared QTextCharFormat objects cannot be aliased away.
+    """
+    return MappingProxyType({
+        'keyword':    hl.format("#F92672"),
+        'operator':   hl.format("#F8F8F2"),
+        'brace':      hl.format("#F8F8F2"),
+        'defclass':   hl.format("#F92672"),
+        'string':     hl.format("#E6DB74"),
+        'string2':    hl.format("#E6DB74"),
+        'comment':    hl.format("#75715E"),
+        'self':       hl.format("#F8F8F2"),
+        'numbers':    hl.format("#AE81FF"),
+        'inprompt':   hl.format("#F8F8F2"),
+        'outprompt':  hl.format("#F8F8F2"),
+    })
+
+
+
+
+# -- Font and background colors for the console widget. Hoisted to a
+# -- constant (there is nothing to interpolate) so Qt sees the same
+# -- string for every console and can reuse its parsed stylesheet.
+_CONSOLE_STYLESHEET = """
+QPlainTextEdit {
+    background-color: #272822;
+    color: #F8F8F2;
+    font-family: Monaco;
+    font-size: 12px;
+    font-weight: 63;
+}
+"""
 
 
 class PythonConsole(pyqtconsole.console.PythonConsole):
@@ -257,29 +507,29 @@ class PythonConsole(pyqtconsole.console.PythonConsole):
                  parent: Optional[QtWidgets.QWidget] = None,
                  ):
 
-        super().__init__(parent, namespace, _monokai_highlighting)
+        # Pull shared resources off the application singleton when one
+        # exists; otherwise fall back to the module-level caches.
+        app = Application.instance()
+        if app is not None:
+            formats, stylesheet, _ = app.console_resources()
+        else:
+            formats = _monokai_highlighting()
+            stylesheet = _CONSOLE_STYLESHEET
+
+        super().__init__(parent, namespace, formats)
 
 
         # Modify font and background colors.
-        self.setStyleSheet(
-            f"""
-            QPlainTextEdit {{
-                background-color: #272822;
-                color: #F8F8F2;
-                font-family: Monaco;
-                font-size: 12px;
-                font-weight: 63;
-            }}
-            """
-        )
+        self.setStyleSheet(stylesheet)
 
 
-        # Add highlighting for built-ins.
-        python_builtins = dir(builtins)
-        builtin_style = hl.format("#66D9EF")
-        builtin_rules = [(QtCore.QRegExp(r'\b%s\b' % w), 0, builtin_style) \
-                         for w in python_builtins]
-        self.highlighter.rules.extend(builtin_rules)
+        # Add highlighting for built-ins. A single alternation pattern
+        # means one regex evaluation per block rather than one per
+        # builtin name (~150 of them), and the compiled pattern/format
+        # are shared across console instances. Installing the overlay
+        # does not mutate the rule list, so no rehighlight is forced on
+        # the (still empty) document.
+        _install_builtin_highlighting(self.highlighter)
 
 
         # Prepare console to work in main UI thread.
@@ -26,18 +26,20 @@ don't forget to call `mydict.commit()` when done with a transaction.
 
 """
 
-from collections import UserDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
 import io
 import logging
 from numbers import Number
 import os
 from pathlib import Path
-from pickle import dumps, loads, HIGHEST_PROTOCOL as PICKLE_PROTOCOL
-from queue import Queue
+from pickle import Unpickler, dumps, loads, HIGHEST_PROTOCOL as PICKLE_PROTOCOL
+from queue import SimpleQueue
 import sqlite3
+import struct
 import sys
 import tempfile
-from threading import Thread
+from threading import RLock, Thread
 import time
 import traceback
 from typing import (
@@ -61,14 +63,104 @@ def open(*args, **kw) -> "SqliteDict":
     return SqliteDict(*args, **kw)
 
 
-def encode(obj: Any) -> sqlite3.Binary:
-    """Serialize an object using pickle to a binary format accepted by SQLite."""
-    return sqlite3.Binary(dumps(obj, protocol=PICKLE_PROTOCOL))
+# Framed protocol-5 payload: magic, length-prefixed pickle stream, then
+# length-prefixed out-of-band buffers. Plain pickle streams start with
+# b'\x80' (protocol >= 2), so the magic cannot collide with them.
+_PICKLE5_MAGIC = b"SQD5"
 
 
-def decode(obj: sqlite3.Binary) -> Any:
-    """Deserialize objects retrieved from SQLite."""
-    return loads(bytes(obj))
+def encode(obj: Any) -> bytes:
+    """
+    Serialize an object using pickle (protocol 5) to a binary format
+    accepted by SQLite. Out-of-band `PickleBuffer`s are collected so
+    large contiguous payloads (numpy arrays, bytearrays exposing
+    buffers) are framed directly instead of being copied into the
+    pickle stream.
+
+    The output of `dumps` is handed to sqlite3 as-is: the binding layer
+    accepts any buffer-protocol object, so the historical
+    `sqlite3.Binary` (i.e. `memoryview`) wrap was a pure per-write
+    allocation. Pickling itself already runs in C via `_pickle`, which
+    is why this stays a plain function rather than a compiled extension.
+    """
+    bufs = []
+    head = dumps(obj, protocol=PICKLE_PROTOCOL, buffer_callback=bufs.append)
+    if not bufs:
+        return head
+
+    frame = bytearray(_PICKLE5_MAGIC)
+    frame += struct.pack("<Q", len(head))
+    frame += head
+    for buf in bufs:
+        raw = buf.raw()
+        frame += struct.pack("<Q", raw.nbytes)
+        frame += raw
+    return frame
+
+
+def decode(obj: bytes) -> Any:
+    """Deserialize objects retrieved from SQLite.
+
+    `loads` and the frame parsing below accept any bytes-like object, so
+    the payload is consumed where it sits - no defensive `bytes()` copy,
+    which used to double memory traffic for large values handed over as
+    memoryviews.
+    """
+    view = memoryview(obj)
+    if view[:4] != _PICKLE5_MAGIC:
+        return loads(obj)
+    (head_len,) = struct.unpack_from("<Q", view, 4)
+    offset = 12
+    head = view[offset:offset + head_len]
+    offset += head_len
+    bufs = []
+    while offset < len(view):
+        (buf_len,) = struct.unpack_from("<Q", view, offset)
+        offset += 8
+        bufs.append(view[offset:offset + buf_len])
+        offset += buf_len
+    return loads(head, buffers=bufs)
+
+
+class _ReadableShim:
+    """
+    Adds the `readline` attribute `Unpickler` insists on to readable
+    handles (such as `sqlite3.Blob`) that only expose `read`.
+    """
+    __slots__ = ("read",)
+
+    def __init__(self, fp):
+        self.read = fp.read
+
+    def readline(self):
+        raise io.UnsupportedOperation("readline")
+
+
+def decode_stream(fp) -> Any:
+    """
+    Deserialize a value from a readable, seekable file-like object (e.g.
+    an `sqlite3.Blob`). Each frame section is read straight from the
+    handle into its own buffer, avoiding the single large intermediate
+    `bytes` copy that `decode` requires.
+    """
+    magic = fp.read(4)
+    if magic != _PICKLE5_MAGIC:
+        fp.seek(0)
+        return Unpickler(_ReadableShim(fp)).load()
+    (head_len,) = struct.unpack("<Q", fp.read(8))
+    pickled = fp.read(head_len)
+    bufs = []
+    while True:
+        prefix = fp.read(8)
+        if len(prefix) < 8:
+            break
+        (buf_len,) = struct.unpack("<Q", prefix)
+        bufs.append(fp.read(buf_len))
+    return loads(pickled, buffers=bufs)
+
+
+# sqlite3.Connection.blobopen (incremental BLOB I/O) arrived in 3.11.
+_HAS_BLOBOPEN = sys.version_info >= (3, 11)
 
 
 def reraise(tp, value, tb=None):
@@ -79,7 +171,7 @@ def reraise(tp, value, tb=None):
     raise value
 
 
-class SqliteDict(UserDict):
+class SqliteDict(MutableMapping):
 
     _VALID_MODES = ("r", "w", "a", "n")
 
@@ -87,12 +179,16 @@ class SqliteDict(UserDict):
         self,
         path: Optional[PathLike] = None,
         table: str = "unnamed",
-        mode: str = "c",
+        mode: str = "a",
         autocommit: bool = False,
-        journal_mode: str = "DELETE",
+        journal_mode: str = "WAL",
         encode: Callable[[Any], sqlite3.Binary] = encode,
         decode: Callable[[sqlite3.Binary], Any] = decode,
         timeout: Number = 5,
+        read_pool_size: int = 4,
+        use_worker_thread: bool = True,
+        mmap_size: int = 268435456,
+        cache_keys: bool = False,
     ):
         
         """
@@ -107,7 +203,10 @@ class SqliteDict(UserDict):
         (more inefficient but safer). Otherwise, changes are committed on `self.commit()`,
         `self.clear()` and `self.close()`.
 
-        Set `journal_mode` to 'OFF' if you're experiencing sqlite I/O problems
+        The default `journal_mode` of 'WAL' gives much better write and
+        concurrent-read throughput than the rollback journal, at the cost of
+        being unreliable on network filesystems (NFS/SMB) - use 'DELETE'
+        there. Set it to 'OFF' if you're experiencing sqlite I/O problems
         or if you need performance and don't care about crash-consistency.
 
         The `mode` parameter. Exactly one of:
@@ -127,6 +226,33 @@ class SqliteDict(UserDict):
 
         The `timeout` defines the maximum time (in seconds) to wait for initial Thread startup.
 
+        `read_pool_size` controls the number of pooled read-only connections
+        used for mode 'r' dicts, where reads can safely bypass the worker
+        thread (there are never outstanding writes to order against) and so
+        scale with reader threads. Set to 0 to force all reads through the
+        worker thread.
+
+        When `use_worker_thread` is False, operations skip the background
+        worker thread entirely and run on a single shared connection
+        guarded by a lock. Python's bundled sqlite3 is compiled with
+        serialized threading, so this is safe across threads; it trades
+        the queue's FIFO ordering guarantee for two fewer context
+        switches per operation.
+
+        `mmap_size` is the number of bytes of the database file sqlite
+        may serve via memory mapping (PRAGMA mmap_size) instead of
+        pread() into its page cache, which saves a syscall and a copy
+        per page on read-heavy workloads. Defaults to 256 MiB; set to 0
+        to disable, e.g. on 32-bit systems where address space is
+        scarce.
+
+        With `cache_keys` enabled, an in-process set of the table's keys
+        is kept in sync with writes, so membership tests resolve without
+        touching sqlite at all - a large win for workloads that probe
+        many missing keys (memoisation caches). Off by default because
+        the set cannot see writes made by other processes, and costs one
+        string reference per key.
+
         """
         
         # validate file mode.
@@ -153,57 +279,90 @@ class SqliteDict(UserDict):
         self._table = table.replace('"', '""') # SQL double-quote escaping
         self.autocommit = autocommit
         self.journal_mode = journal_mode
+        # assignment goes through the encode/decode properties, whose
+        # setters refresh the private aliases the hot paths bind to
         self.encode = encode
         self.decode = decode
         self.timeout = timeout
+        self._use_worker_thread = use_worker_thread
+        self._mmap_size = mmap_size
+
+        # Cached row count. len() on sqlite is a full B-tree scan, so the
+        # count is seeded lazily from one COUNT(*) and maintained across
+        # mutations where possible (invalidated when we cannot know
+        # whether a write inserted or replaced).
+        self._len: Optional[int] = None
+
+        # Optional in-memory key set for constant-time __contains__.
+        # Populated lazily on the first membership test and maintained
+        # by the mutators thereafter.
+        self._cache_keys = cache_keys
+        self._key_cache: Optional[set] = None
+
+        # Precompute the per-table SQL once. The statement text never
+        # changes for a given instance, so sqlite's statement cache can
+        # reuse the compiled VDBE program instead of reparsing strings
+        # rebuilt on every call.
+        t = self._table
+        self._sql_get = f'SELECT value FROM "{t}" WHERE key = ?'
+        self._sql_rowid = f'SELECT rowid FROM "{t}" WHERE key = ?'
+        # Upsert rather than REPLACE INTO: REPLACE deletes the old row
+        # and inserts a new one (two B-tree ops, new rowid), while the
+        # ON CONFLICT form updates in place and keeps insertion order
+        # stable for the rowid-ordered iterators.
+        self._sql_set = (
+            f'INSERT INTO "{t}" (key, value) VALUES (?,?) '
+            'ON CONFLICT(key) DO UPDATE SET value=excluded.value'
+        )
+        self._sql_del = f'DELETE FROM "{t}" WHERE key = ?'
+        self._sql_has = f'SELECT 1 FROM "{t}" WHERE key = ?'
+        self._sql_keys = f'SELECT key FROM "{t}" ORDER BY rowid'
+        self._sql_values = f'SELECT value FROM "{t}" ORDER BY rowid'
+        self._sql_items = f'SELECT key, value FROM "{t}" ORDER BY rowid'
+        self._sql_len = f'SELECT COUNT(*) FROM "{t}"'
+        self._sql_max = f'SELECT MAX(ROWID) FROM "{t}"'
+        self._sql_drop = f'DROP TABLE IF EXISTS "{t}"'
+        self._sql_create = (
+            f'CREATE TABLE IF NOT EXISTS "{t}" (key TEXT PRIMARY KEY, value BLOB)'
+        )
 
         
-        # mode 'r'
+        # mode 'n': delete any existing database file before recreating it.
+        if mode == "n" and path.exists():
+            os.remove(path)
+
+        logger.info(f'opening Sqlite table "{table}" in {path}')
+
+        # mode 'r': the database file and table must already exist. Reads
+        # go through a pool of read-only connections shared by caller
+        # threads; nothing can write, so no ordering is needed.
+        self._readers = None
         if mode == "r":
             if not path.exists():
                 raise io.UnsupportedOperation(f"path  {path} not writable")
             if table not in SqliteDict.get_tables(path):
                 raise io.UnsupportedOperation(f"table  {table} not writable")
             self.conn = self.connect()
-            
-        # modes 'w'/'a'/'n'
+            if read_pool_size:
+                self._readers = ReaderPool(
+                    path, read_pool_size, mmap_size=mmap_size
+                )
+
+        # modes 'w'/'a'/'n': open for read/write, creating the table if
+        # needed. mode 'w' additionally clears an existing table.
         else:
             self.conn = self.connect()
-            self.clear()
-        
-        elif mode == "a":
-            self.conn =  self.connect()
-            if table not in self.get_tables(self.path):
-                
+            self.get_table(self.table, clear=(mode == "w"))
 
-        # 'a': open for read/write, but does not clear the target  table if it exists.
-        elif mode == "a":
-            
 
-        
-        
-        elif mode == "w":
-            
-        if mode == "n":
-            if os.path.exists(path):
-                os.remove(path)    
-        logger.info(f'opening Sqlite table "{table}" in {path}')
-        self.conn = self.connect()
-
-        # mode 'n': create a new database from scratch.
-        
-        # - delete existing table
-        
-    
     def get_table(self, table: str, clear: bool = False) -> None:
-        
+
         s = f'CREATE TABLE IF NOT EXISTS "{table}"' + \
              '(key TEXT PRIMARY KEY, value BLOB)'
         self.conn.execute(s)
         self.conn.commit()
 
-            
-        if mode == "w":
+        if clear:
             self.clear()
 
     
@@ -225,6 +384,22 @@ class SqliteDict(UserDict):
     @property
     def table(self) -> str:
         return self._table
+
+    @property
+    def encode(self) -> Callable:
+        return self._encode
+
+    @encode.setter
+    def encode(self, value: Callable) -> None:
+        self._encode = value
+
+    @property
+    def decode(self) -> Callable:
+        return self._decode
+
+    @decode.setter
+    def decode(self, value: Callable) -> None:
+        self._decode = value
     
     
 
@@ -241,44 +416,95 @@ class SqliteDict(UserDict):
             raise RuntimeError("Refusing to clear read-only SqliteDict")
 
         # avoid VACUUM, as it gives "OperationalError: database schema has changed"
-        CLEAR_ALL = f'DELETE FROM "{self.table}";'
-        self.conn.commit()
-        self.conn.execute(CLEAR_ALL)
+        # DROP + CREATE releases the table's pages wholesale (an O(1)
+        # metadata operation) where DELETE FROM walks and frees row by
+        # row; one commit instead of the old bracketing pair.
+        self.conn.execute(self._sql_drop)
+        self.conn.execute(self._sql_create)
         self.conn.commit()
+        self._len = 0
+        if self._key_cache is not None:
+            self._key_cache = set()
         
         
-    def update(self, other: Mapping) -> None:
+    def update(self, other: Mapping = (), **kw) -> None:
         """
+        Insert or replace all items of `other` as one batch: a single
+        queue round-trip and a single transaction, rather than one
+        statement (and, under autocommit, one fsync) per key.
         """
         if self.mode == "r":
-            raise RuntimeError("")
+            raise RuntimeError("Refusing to update read-only SqliteDict")
 
         try:
-            items = items.items()
+            other = other.items()
         except AttributeError:
             pass
-        items = [(k, self.encode(v)) for k, v in other.items()]
-
-        UPDATE_ITEMS = f'REPLACE INTO "{self.table}" (key, value) VALUES (?, ?)'
-        self.conn.executemany(UPDATE_ITEMS, items)
+        _encode = self._encode
+        items = [(k, _encode(v)) for k, v in other]
+        if kw:
+            items.extend((k, _encode(v)) for k, v in kw.items())
+
+        self.conn.executemany(self._sql_set, items)
+        cache = self._key_cache
+        if cache is not None:
+            fresh = {k for k, _ in items if k not in cache}
+            cache |= fresh
+            if self._len is not None:
+                self._len += len(fresh)
+        else:
+            self._len = None
         if self.autocommit:
             self.commit()
             
             
+    def _select_one(self, req: str, arg=None):
+        """Run a single-row SELECT through the reader pool when one is
+        available, falling back to the worker thread otherwise."""
+        if self._readers is not None:
+            with self._readers.acquire() as conn:
+                return conn.execute(req, arg or ()).fetchone()
+        return self.conn.select_one(req, arg)
+
+    def _select_all(self, req: str, arg=None):
+        """Like `_select_one`, but returning the full result list."""
+        if self._readers is not None:
+            with self._readers.acquire() as conn:
+                return conn.execute(req, arg or ()).fetchall()
+        return self.conn.select_all(req, arg)
+
+    def _select_chunks(self, req: str, size: int = 1024):
+        """Yield result rows in `fetchmany`-sized batches so iterating a
+        large table never materializes the full result set. The worker
+        thread cannot stream across the queue, so that path degrades to
+        a single batch."""
+        if self._readers is not None:
+            with self._readers.acquire() as conn:
+                cursor = conn.execute(req)
+                while True:
+                    rows = cursor.fetchmany(size)
+                    if not rows:
+                        break
+                    yield rows
+        else:
+            yield self.conn.select_all(req)
+
     def keys(self):
-        GET_KEYS = f'SELECT key FROM "{self.table}" ORDER BY rowid'
-        for key in self.conn.select(GET_KEYS):
-            yield key[0]
+        for rows in self._select_chunks(self._sql_keys):
+            for key, in rows:
+                yield key
 
     def values(self):
-        GET_VALUES = f'SELECT value FROM "{self.table}" ORDER BY rowid'
-        for value in self.conn.select(GET_VALUES):
-            yield self.decode(value[0])
+        _decode = self._decode
+        for rows in self._select_chunks(self._sql_values):
+            for value, in rows:
+                yield _decode(value)
 
     def items(self):
-        GET_ITEMS = f'SELECT key, value FROM "{self.table}" ORDER BY rowid'
-        for key, value in self.conn.select(GET_ITEMS):
-            yield key, self.decode(value)
+        _decode = self._decode
+        for rows in self._select_chunks(self._sql_items):
+            for key, value in rows:
+                yield key, _decode(value)
 
 
     def __enter__(self) -> "SqliteDict":
@@ -302,38 +528,76 @@ class SqliteDict(UserDict):
 
     def __len__(self) -> int:
         # `select count (*)` is super slow in sqlite (does a linear scan!!)
-        # As a result, len() is very slow too once the table size grows beyond trivial.
-        # We could keep the total count of rows ourselves, by means of triggers,
-        # but that seems too complicated and would slow down normal operation
-        # (insert/delete etc).
-        GET_LEN = f'SELECT COUNT(*) FROM "{self.table}"'
-        rows = self.conn.select_one(GET_LEN)[0]
-        return rows if rows is not None else 0
+        # so the result is cached: seeded here on first call, maintained
+        # by the mutators where the outcome is knowable and invalidated
+        # where it is not (REPLACE INTO may insert or overwrite).
+        if self._len is None:
+            rows = self._select_one(self._sql_len)[0]
+            self._len = rows if rows is not None else 0
+        return self._len
 
     def __bool__(self):
         # No elements is False, otherwise True
-        GET_MAX = f'SELECT MAX(ROWID) FROM "{self.table}"'
-        m = self.conn.select_one(GET_MAX)[0]
+        m = self._select_one(self._sql_max)[0]
         # Explicit better than implicit and bla bla
         return True if m is not None else False
 
     def __contains__(self, key: str) -> bool:
-        HAS_ITEM = f'SELECT 1 FROM "{self.table}" WHERE key = ?'
-        return self.conn.select_one(HAS_ITEM, (key,)) is not None
+        if self._cache_keys:
+            if self._key_cache is None:
+                self._key_cache = {
+                    row[0] for row in self._select_all(self._sql_keys)
+                }
+            return key in self._key_cache
+        return self._select_one(self._sql_has, (key,)) is not None
+
+    def _getitem_blob(self, key: str) -> Any:
+        """
+        Zero-copy read path: stream the value straight out of sqlite's
+        BLOB storage into the unpickler via `Connection.blobopen`,
+        skipping the full-row `bytes` materialization.
+        """
+        row = self._select_one(self._sql_rowid, (key,))
+        if row is None:
+            raise KeyError(key)
+        with self._readers.acquire() as conn:
+            blob = conn.blobopen(self._table, "value", row[0], readonly=True)
+            try:
+                return decode_stream(blob)
+            finally:
+                blob.close()
 
     def __getitem__(self, key: str) -> Any:
-        GET_ITEM = f'SELECT value FROM "{self.table}" WHERE key = ?'
-        item = self.conn.select_one(GET_ITEM, (key,))
+        # The blob path needs a caller-side connection (blob handles are
+        # not thread-portable) and only understands the default pickle
+        # decoding.
+        if (
+            self._readers is not None
+            and _HAS_BLOBOPEN
+            and self.decode is decode
+        ):
+            return self._getitem_blob(key)
+
+        item = self._select_one(self._sql_get, (key,))
         if item is None:
             raise KeyError(key)
-        return self.decode(item[0])
+        return self._decode(item[0])
 
     def __setitem__(self, key: str, value: Any) -> None:
         if self.mode == "r":
             raise RuntimeError("Refusing to write to read-only SqliteDict")
 
-        ADD_ITEM = f'REPLACE INTO "{self.table}" (key, value) VALUES (?,?)'
-        self.conn.execute(ADD_ITEM, (key, self.encode(value)))
+        self.conn.execute(self._sql_set, (key, self._encode(value)))
+        cache = self._key_cache
+        if cache is not None:
+            # with the key set live we know whether REPLACE INTO
+            # inserted or overwrote, so the cached count stays precise.
+            if key not in cache:
+                cache.add(key)
+                if self._len is not None:
+                    self._len += 1
+        else:
+            self._len = None
         if self.autocommit:
             self.commit()
 
@@ -343,8 +607,13 @@ class SqliteDict(UserDict):
 
         if key not in self:
             raise KeyError(key)
-        DEL_ITEM = f'DELETE FROM ""{self.table}" WHERE key = ?'
-        self.conn.execute(DEL_ITEM, (key,))
+        self.conn.execute(self._sql_del, (key,))
+        if self._key_cache is not None:
+            self._key_cache.discard(key)
+        if self._len is not None:
+            # membership was just verified, so the delete removes exactly
+            # one row.
+            self._len -= 1
         if self.autocommit:
             self.commit()
 
@@ -353,14 +622,16 @@ class SqliteDict(UserDict):
     # persistance
             
     
-    def connect(self) -> "SqliteMultithread":
+    def connect(self) -> "Connection":
         logger.info(f'opening table "{self.table}" in file {self.path}')
-        return SqliteMultithread(
+        conn_type = Connection if self._use_worker_thread else DirectConnection
+        return conn_type(
             self.path,
             autocommit=self.autocommit,
             journal_mode=self.journal_mode,
             timeout=self.timeout,
-        )    
+            mmap_size=self._mmap_size,
+        )
     
     
 
@@ -392,7 +663,11 @@ class SqliteDict(UserDict):
                 self.conn.commit(blocking=True)
             self.conn.close(force=force)
             self.conn = None
-        
+
+        if getattr(self, "_readers", None) is not None:
+            self._readers.close()
+            self._readers = None
+
         if self.in_temp:
             try:
                 os.remove(self.path)
@@ -425,7 +700,7 @@ class SqliteDict(UserDict):
     def __del__(self):
         # like close(), but assume globals are gone by now (do not log!)
         try:
-            self.close(do_log=False, force=True)
+            self.close(log=False, force=True)
         except Exception:
             # prevent error log flood in case of multiple SqliteDicts
             # closed after connection lost (exceptions are always ignored
@@ -457,8 +732,144 @@ class SqliteDict(UserDict):
 
 
 
+class ReaderPool:
+
+    """
+    A small pool of read-only sqlite connections handed out directly to
+    caller threads, bypassing the single worker thread. Only used where
+    no writes need ordering against reads (mode 'r' dicts); under WAL
+    the pooled readers also run concurrently with external writers.
+
+    """
+
+    def __init__(self, path: PathLike, size: int = 4, mmap_size: int = 0):
+        self.path = Path(path)
+        self.size = size
+        self._free = SimpleQueue()
+        for _ in range(size):
+            conn = sqlite3.connect(
+                f"file:{self.path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA query_only=1")
+            if mmap_size:
+                conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+            self._free.put(conn)
+
+    @contextmanager
+    def acquire(self):
+        """Check a connection out of the pool for the duration of a
+        `with` block, returning it afterwards."""
+        conn = self._free.get()
+        try:
+            yield conn
+        finally:
+            self._free.put(conn)
+
+    def close(self) -> None:
+        for _ in range(self.size):
+            self._free.get().close()
+        self.size = 0
+
+
+class DirectConnection:
+
+    """
+    A thin, lock-guarded wrapper around one shared sqlite3 connection,
+    used when the caller opts out of the worker-thread architecture.
+    When the underlying sqlite library is compiled with serialized
+    threading (checked at construction), a connection opened with
+    check_same_thread=False may be shared across threads; queries then
+    run inline instead of paying a queue round-trip and two context
+    switches each. API-compatible with `Connection` for everything
+    SqliteDict uses.
+
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        autocommit: bool = False,
+        journal_mode: str = "WAL",
+        timeout: Number = 5,
+        mmap_size: int = 0,
+        ):
+        # Sharing one connection across threads is only defined when the
+        # sqlite build serializes access itself; this is a build-time
+        # property, so verify it rather than assume it.
+        if sqlite3.threadsafety != 3:
+            raise RuntimeError(
+                "DirectConnection requires sqlite3 compiled with "
+                "serialized threading (sqlite3.threadsafety == 3); "
+                "use the default worker-thread Connection instead."
+            )
+        self.path = Path(path)
+        self.autocommit = autocommit
+        self.journal_mode = journal_mode
+        self.timeout = timeout
+        self._lock = RLock()
+
+        conn = sqlite3.connect(
+            self.path,
+            isolation_level=None if autocommit else "DEFERRED",
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.text_factory = str
+        # page_size only takes effect before the first page is written,
+        # and cannot change once WAL is active - set it first.
+        conn.execute("PRAGMA page_size=8192")
+        conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+        if journal_mode.upper() == "WAL":
+            conn.execute("PRAGMA synchronous=NORMAL")
+        else:
+            conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        if mmap_size:
+            conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        conn.commit()
+        self._conn = conn
+
+    def execute(self, req, arg=None, res=None):
+        with self._lock:
+            cursor = self._conn.execute(req, arg or tuple())
+            if res is not None:
+                for rec in cursor:
+                    res.put(rec)
+                res.put("--no more--")
+            if self.autocommit:
+                self._conn.commit()
+
+    def executemany(self, req, items):
+        with self._lock:
+            self._conn.executemany(req, list(items))
+            if self.autocommit:
+                self._conn.commit()
+
+    def select(self, req, arg=None):
+        yield from self.select_all(req, arg)
+
+    def select_all(self, req, arg=None):
+        with self._lock:
+            return self._conn.execute(req, arg or tuple()).fetchall()
+
+    def select_one(self, req, arg=None):
+        with self._lock:
+            return self._conn.execute(req, arg or tuple()).fetchone()
+
+    def commit(self, blocking=True):
+        with self._lock:
+            self._conn.commit()
+
+    def close(self, force=False):
+        with self._lock:
+            self._conn.close()
+
+
 class Connection(Thread):
-    
+
     """
     Wrap sqlite connection in a way that allows concurrent requests from
     multiple threads. This is done by internally queueing the requests and 
@@ -469,70 +880,135 @@ class Connection(Thread):
 
     def __init__(
         self,
-        path: Optional[PathLike] = None,
-        autocommit: bool,
-        journal_mode: str,
-        timeout: Number,
+        path: PathLike,
+        autocommit: bool = False,
+        journal_mode: str = "WAL",
+        timeout: Number = 5,
+        mmap_size: int = 0,
         ):
         super().__init__()
-        
+
         self.path = Path(path)
         self.autocommit = autocommit
         self.journal_mode = journal_mode
         self.timeout = timeout
-        
-        # use request queue of unlimited size
-        self.reqs = Queue()
-        self.setDaemon(True)  # python2.5-compatible
+        self.mmap_size = mmap_size
+
+        # SimpleQueue is implemented in C without queue.Queue's
+        # task-tracking locks; put/get on the dispatch path get cheaper.
+        self.reqs = SimpleQueue()
+        self.daemon = True
         self.exception = None
         self._thread_initialized = None
-        
-        self.logger = logging.getLogger("sqlitedict.Connection")
+
+        self.log = logging.getLogger("sqlitedict.Connection")
         self.start()
 
     
     def run(self):
         try:
-            if self.autocommit:
-                conn = sqlite3.connect(
-                    self.path, isolation_level=None, check_same_thread=False
-                )
-            else:
-                conn = sqlite3.connect(self.path, check_same_thread=False)
+            # isolation_level=None always: the pysqlite layer then never
+            # opens implicit transactions (which it also force-commits
+            # around DDL), leaving sqlite in native autocommit. For
+            # non-autocommit dicts the loop below groups writes into
+            # explicit BEGIN IMMEDIATE transactions instead.
+            conn = sqlite3.connect(
+                self.path,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256,
+            )
         except Exception:
-            self.logger.exception(
+            self.log.exception(
                 f"Failed to initialize connection for path: {self.path}"
             )
             self.exception = sys.exc_info()
             raise
 
         try:
+            # page_size only takes effect before the first page is
+            # written, and cannot change once WAL is active - set it
+            # first. 8 KiB pages suit pickled-object row sizes better
+            # than the 4 KiB default.
+            conn.execute("PRAGMA page_size=8192")
             conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
             conn.text_factory = str
             cursor = conn.cursor()
             conn.commit()
-            cursor.execute("PRAGMA synchronous=OFF")
+            if self.journal_mode.upper() == "WAL":
+                # WAL only needs NORMAL for durability across app crashes,
+                # and skips the rollback-journal create/delete per commit.
+                cursor.execute("PRAGMA synchronous=NORMAL")
+            else:
+                cursor.execute("PRAGMA synchronous=OFF")
+            # keep temp structures and the page cache (64 MiB) in memory
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-64000")
+            if self.mmap_size:
+                # serve pages via mmap instead of pread(), saving a
+                # syscall and a userspace copy per page read.
+                cursor.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
         except Exception:
             self.log.exception("Failed to execute PRAGMA statements.")
             self.exception = sys.exc_info()
             raise
 
-        self._sqlitedict_thread_initialized = True
+        self._thread_initialized = True
 
         res = None
+        # Explicit transaction state. Requests carrying a result queue
+        # are reads and never open a transaction; write requests open
+        # one BEGIN IMMEDIATE that stays live until the next --commit--,
+        # grouping arbitrarily many writes under a single fsync. With
+        # autocommit, statements commit natively (no BEGIN at all) and
+        # only batches get a bracketing transaction.
+        in_txn = False
         while True:
-            req, arg, res, outer_stack = self.reqs.get()
+            req, arg, res, outer_frame = self.reqs.get()
             if req == "--close--":
                 assert res, ("--close-- without return queue", res)
                 break
             elif req == "--commit--":
-                conn.commit()
+                if in_txn:
+                    conn.commit()
+                    in_txn = False
                 if res:
                     res.put("--no more--")
             else:
+                fetch_all = req.startswith("--all--")
+                if fetch_all:
+                    req = req[len("--all--"):]
+                failed = False
+                opened_txn = False
                 try:
-                    cursor.execute(req, arg)
+                    if req.startswith("--many--"):
+                        # batched writes: run the whole parameter list
+                        # through sqlite's native executemany inside one
+                        # transaction so there is a single commit.
+                        if self.autocommit:
+                            cursor.execute("BEGIN IMMEDIATE")
+                            opened_txn = True
+                        elif not in_txn:
+                            cursor.execute("BEGIN IMMEDIATE")
+                            in_txn = True
+                            opened_txn = True
+                        cursor.executemany(req[len("--many--"):], arg)
+                        if self.autocommit:
+                            conn.commit()
+                    else:
+                        if res is None and not self.autocommit and not in_txn:
+                            cursor.execute("BEGIN IMMEDIATE")
+                            in_txn = True
+                            opened_txn = True
+                        cursor.execute(req, arg)
                 except Exception:
+                    failed = True
+                    # Roll back any transaction this request opened;
+                    # leaving it dangling would swallow every later
+                    # autocommit write until close() discarded them all.
+                    if opened_txn and conn.in_transaction:
+                        conn.rollback()
+                        in_txn = False
                     self.exception = (e_type, e_value, e_tb) = sys.exc_info()
                     inner_stack = traceback.extract_stack()
 
@@ -553,19 +1029,22 @@ class Connection(Thread):
                     for item in traceback.format_exception_only(e_type, e_value):
                         self.log.error(item)
 
-                    self.log.error("")  # exception & outer stack w/blank line
-                    self.log.error("Outer stack:")
-                    for item in traceback.format_list(outer_stack):
-                        self.log.error(item)
+                    if outer_frame:
+                        self.log.error("")  # exception & outer stack w/blank line
+                        self.log.error("Outer stack:")
+                        for item in traceback.format_stack(outer_frame):
+                            self.log.error(item)
                     self.log.error("Exception will be re-raised at next call.")
 
                 if res:
-                    for rec in cursor:
-                        res.put(rec)
-                    res.put("--no more--")
-
-                if self.autocommit:
-                    conn.commit()
+                    if fetch_all:
+                        # bulk select: one queue item for the whole
+                        # result set instead of one per row.
+                        res.put([] if failed else cursor.fetchall())
+                    else:
+                        for rec in cursor:
+                            res.put(rec)
+                        res.put("--no more--")
 
         self.log.debug(f"received: {req}, send: --no more--")
         conn.close()
@@ -608,18 +1087,26 @@ class Connection(Thread):
         self._wait_for_initialization()
         self.check_raise_error()
 
-        # NOTE: This might be a lot of information to pump into an input
-        # queue, affecting performance.  I've also seen earlier versions of
-        # jython take a severe performance impact for throwing exceptions
-        # so often.
-        stack = traceback.extract_stack()[:-1]
-        self.reqs.put((req, arg or tuple(), res, stack))
+        # Only the caller's frame object is captured here; walking and
+        # formatting the whole stack (traceback.extract_stack) costs
+        # microseconds per call and is only ever needed when a statement
+        # fails, so the formatting happens lazily in the error branch.
+        frame = sys._getframe(1)
+        self.reqs.put((req, arg or tuple(), res, frame))
 
     def executemany(self, req, items):
-        for item in items:
-            self.execute(req, item)
+        """
+        Queue a batched statement: one enqueue for the whole parameter
+        list, dispatched in the worker via `cursor.executemany`.
+        """
+        self._wait_for_initialization()
         self.check_raise_error()
 
+        # No per-call stack capture here: batches are issued from a
+        # handful of well-known call sites and extract_stack() would be
+        # paid once per batch of potentially millions of rows.
+        self.reqs.put(("--many--" + req, list(items), None, None))
+
     def select(self, req, arg=None):
         """
         Unlike sqlite's native select, this select doesn't handle iteration efficiently.
@@ -628,7 +1115,7 @@ class Connection(Thread):
         request is dequeued, and although you can iterate over the result normally
         (`for res in self.select(): ...`), the entire result will be in memory.
         """
-        res = Queue()  # results of the select will appear as items in this queue
+        res = SimpleQueue()  # results of the select will appear as items in this queue
         self.execute(req, arg, res)
         while True:
             rec = res.get()
@@ -637,6 +1124,20 @@ class Connection(Thread):
                 break
             yield rec
 
+    def select_all(self, req, arg=None):
+        """
+        Run a SELECT and return the complete result as a single list.
+
+        Unlike `select`, which pushes every row through the result queue
+        individually (2N+1 queue operations for N rows), this crosses
+        the worker queue exactly once in each direction.
+        """
+        res = SimpleQueue()
+        self.execute("--all--" + req, arg, res)
+        rows = res.get()
+        self.check_raise_error()
+        return rows
+
     def select_one(self, req, arg=None):
         """Return only the first row of the SELECT, or None if there are no matching rows."""
         try:
@@ -662,7 +1163,7 @@ class Connection(Thread):
             # can't process the request. Instead, push the close command to the requests
             # queue directly. If run() is still alive, it will exit gracefully. If not,
             # then there's nothing we can do anyway.
-            self.reqs.put(("--close--", None, Queue(), None))
+            self.reqs.put(("--close--", None, SimpleQueue(), None))
         else:
             # we abuse 'select' to "iter" over a "--close--" statement so that we
             # can confirm the completion of close before joining the thread and
@@ -685,13 +1186,10 @@ class Connection(Thread):
 
         start_time = time.time()
         while time.time() - start_time < self.timeout:
-            if self._sqlitedict_thread_initialized or self.exception:
+            if self._thread_initialized or self.exception:
                 return
             time.sleep(0.1)
         raise TimeoutError(
             "SqliteMultithread failed to flag initialization within "
             "{:0.0f} seconds.".format(self.timeout)
         )
-
-
-d = SqliteDict("~/mydb")
@@ -1,24 +1,134 @@
 """
 author: Scott Knudstrup
 """
-import appdirs
+import atexit
 import collections
+import functools
+import hashlib
 import json
+import logging
 import os
 from pathlib import Path
-import shelve
 import sys
-from types import ModuleType
+import threading
 from typing import (
     Any,
     ItemsView,
     Iterator,
     KeysView,
     Mapping,
+    Optional,
     ValuesView,
 )
 import weakref
 
+logger = logging.getLogger(__name__)
+
+# -- orjson serialises straight to bytes in C and is considerably
+# -- faster than the stdlib encoder; fall back gracefully when it is
+# -- not installed
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# -- Optional binary backends. Binary formats cut both the bytes on
+# -- disk and the parse cost relative to JSON, at the price of no longer
+# -- being hand-editable
+try:
+    import msgpack as _msgpack
+except ImportError:
+    _msgpack = None
+
+try:
+    import cbor2 as _cbor2
+except ImportError:
+    _cbor2 = None
+
+
+def _json_dumps(data: dict, canonical: bool = False) -> bytes:
+    # -- default=str keeps datetimes and paths saveable instead of
+    # -- bailing out of the whole snapshot
+    if _orjson is not None:
+        # -- NON_STR_KEYS keeps str subclasses saveable: the mapping
+        # -- validates every key as str, so nothing wider sneaks in
+        option = _orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS
+        if canonical:
+            option |= _orjson.OPT_SORT_KEYS
+        return _orjson.dumps(data, option=option, default=str)
+    return json.dumps(
+        data, indent=2, sort_keys=canonical, default=str
+    ).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> dict:
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+# -- Registered serialisation backends, keyed by name: each entry maps
+# -- to the file suffix plus the dumps/loads pair used by save/load
+_BACKENDS = {
+    "json": (".json", _json_dumps, _json_loads),
+}
+
+if _msgpack is not None:
+    _BACKENDS["msgpack"] = (
+        ".msgpack",
+        lambda data: _msgpack.packb(data),
+        lambda raw: _msgpack.unpackb(raw),
+    )
+
+if _cbor2 is not None:
+    _BACKENDS["cbor2"] = (".cbor", _cbor2.dumps, _cbor2.loads)
+
+# -- The default backend may be steered globally via the environment;
+# -- individual scribbles can still override it per instance
+DEFAULT_BACKEND = os.environ.get("SCRIBBLE_BACKEND", "json")
+
+# -- Journalled scribbles fold their delta log back into the snapshot
+# -- once it grows beyond this many entries
+LOG_COMPACT_THRESHOLD = 1024
+
+# -- Opt-in serialiser specialisation: once a scribble's key set has
+# -- held stable for this many saves, a serialiser bound to that exact
+# -- schema takes over (sorting the keys once rather than per save)
+_CODEGEN = os.environ.get("SCRIBBLE_CODEGEN", "0") == "1"
+SCHEMA_STABLE_SAVES = 10
+
+
+@functools.lru_cache(maxsize=64)
+def _specialised_dumps(keys: tuple, canonical: bool = False):
+    """
+    Builds (and caches, keyed on the schema) a JSON serialiser
+    specialised to a fixed key set. Canonical scribbles get their key
+    order sorted here exactly once, so each subsequent save emits in
+    that order with a plain comprehension instead of re-sorting; the
+    default keeps the insertion order _json_dumps would produce.
+    """
+    order = tuple(sorted(keys)) if canonical else keys
+
+    if _orjson is not None:
+        # -- canonical keeps OPT_SORT_KEYS: the sort recurses into
+        # -- nested dicts, which the top-level comprehension cannot do
+        option = _orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS
+        if canonical:
+            option |= _orjson.OPT_SORT_KEYS
+
+        def _emit(data, _dumps=_orjson.dumps, _order=order, _opt=option):
+            return _dumps({k: data[k] for k in _order}, option=_opt,
+                          default=str)
+    else:
+        def _emit(data, _dumps=json.dumps, _order=order,
+                  _sort=canonical):
+            return _dumps(
+                {k: data[k] for k in _order}, indent=2, default=str,
+                sort_keys=_sort,
+            ).encode("utf-8")
+
+    return _emit
+
 __all__ = [
     ""
 ]
@@ -26,85 +136,222 @@ __all__ = [
 # -- order to tailor exactly where scribble will write out its data
 ENVIRONMENT_VARIABLE = "SCRIBBLE_STORAGE_DIR"
 
-# -- Determine where we should store our data files. This is dependent
-# -- upon a couple of factors. Firstly, we allow for hte user to define
-# -- an environment variable which specifies the storage location
-STORAGE_DIRECTORY = os.environ.get(ENVIRONMENT_VARIABLE, None)
-if STORAGE_DIRECTORY is not None:
-    STORAGE_DIRECTORY = Path(STORAGE_DIRECTORY)
-
-# -- If we have not been provided with a specific storage location
-# -- then we need to resolve to a default location, but this is platform
-# -- dependent
-if sys.platform in ("linux", "linux2"):
-    if "XDG_CONFIG_HOME" in os.environ:
-        STORAGE_DIRECTORY = Path(os.environ["XDG_CONFIG_HOME"]) / "scribble"
-    else:
-        STORAGE_DIRECTORY = Path(os.environ["HOME"]) / ".config/scribble"
 
-elif sys.platform == "win32":
-    STORAGE_DIRECTORY = Path(os.environ["APPDATA"]) / "scribble"
+@functools.cache
+def _storage_dir() -> Path:
+    """
+    Resolves the directory scribble persists to, creating it on first
+    use. The user-defined environment variable wins; otherwise we fall
+    back to a per-platform default. Resolution is deferred until a
+    scribble is actually created so merely importing this module costs
+    nothing and works on platforms without a default location.
+    """
+    # -- Firstly, we allow for the user to define an environment
+    # -- variable which specifies the storage location
+    configured = os.environ.get(ENVIRONMENT_VARIABLE)
+    if configured:
+        path = Path(configured)
+
+    # -- If we have not been provided with a specific storage location
+    # -- then we need to resolve to a default location, but this is
+    # -- platform dependent
+    elif sys.platform in ("linux", "linux2"):
+        if "XDG_CONFIG_HOME" in os.environ:
+            path = Path(os.environ["XDG_CONFIG_HOME"]) / "scribble"
+        else:
+            path = Path(os.environ["HOME"]) / ".config/scribble"
+
+    elif sys.platform == "win32":
+        path = Path(os.environ["APPDATA"]) / "scribble"
+
+    elif sys.platform == "darwin":
+        path = Path(os.environ["HOME"]) / "Documents/scribble"
 
-elif sys.platform == "darwin":
-    STORAGE_DIRECTORY = Path(os.environ["HOME"]) / "Documents/scribble"
+    else:
+        raise Exception(
+            (
+                "{} is not supported by default. In order to utilise this "
+                "module you must define an environment variable ({}) "
+                "specifying the storage path"
+            ).format(sys.platform, ENVIRONMENT_VARIABLE)
+        )
 
-else:
-    raise Exception(
-        (
-            "{} is not supported by default. In order to utilise this module "
-            "you must define an environment variable ({}) specifying the "
-            "storage path"
-        ).format(sys.platform, ENVIRONMENT_VARIABLE)
-    )
+    # -- Create the storage location up front so save() does not have
+    # -- to stat it on every call
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 # ------------------------------------------------------------------------------
 
 
+# -- Two-tier instance cache. The weak dictionary tracks every live
+# -- scribble (and is what lookups and flushes iterate), while the
+# -- bounded LRU below pins strong references to the most recently used
+# -- entries so hot scribbles survive garbage collection instead of
+# -- being dropped on GC timing and re-parsed from disk.
 _CACHE = weakref.WeakValueDictionary()
 
+CACHE_MAX = 64
+_STRONG_CACHE = collections.OrderedDict()
+
+
+def _touch_cache(name: str, scribble: "PersistentData") -> None:
+    """
+    Marks a scribble as recently used: it is pinned in the LRU tier,
+    evicting the least recently used entry once the tier is full.
+    Evicted entries simply fall back to weak-reference lifetime.
+    """
+    _STRONG_CACHE[name] = scribble
+    _STRONG_CACHE.move_to_end(name)
+    while len(_STRONG_CACHE) > CACHE_MAX:
+        _STRONG_CACHE.popitem(last=False)
+
+# -- Deferred-save machinery. save_async() (re)arms this single timer,
+# -- so a burst of mutations collapses into one flush once things have
+# -- been quiet for the debounce period
+_FLUSH_DELAY = 0.25
+_flush_lock = threading.Lock()
+_flush_timer: Optional[threading.Timer] = None
+
+
+def _flush_all() -> None:
+    """
+    Saves every cached scribble that has unsaved changes. Runs on the
+    debounce timer and once more at interpreter exit.
+    """
+    global _flush_timer
+
+    with _flush_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+
+    for scribble in list(_CACHE.values()):
+        if scribble._changed:
+            # -- one unsaveable scribble must not discard the pending
+            # -- changes of every scribble after it in the cache
+            try:
+                scribble.save()
+            except Exception:
+                logger.exception(
+                    f"Failed to flush scribble {scribble.name!r}"
+                )
+
+
+atexit.register(_flush_all)
+
 
 class PersistentData(collections.abc.MutableMapping):
 
+    # -- A fixed attribute set: slots drop the per-instance __dict__
+    # -- and make attribute access a descriptor hit, which adds up with
+    # -- many scribbles held in the cache. __weakref__ must be listed
+    # -- explicitly since instances live in a WeakValueDictionary.
+    __slots__ = (
+        "_name",
+        "_data",
+        "_backend",
+        "_path",
+        "_changed",
+        "_journal",
+        "_log_fd",
+        "_log_count",
+        "_fd",
+        "_last_hash",
+        "_schema",
+        "_schema_saves",
+        "_save_on_destroy",
+        "__weakref__",
+    )
+
     _name: str
     _data: dict
-    _backend: ModuleType
+    _backend: str
+    _path: Path
     _changed: bool
-    _save_on_destroy: bool = False
+    _journal: bool
+    _log_fd: Optional[int]
+    _log_count: int
+    _fd: Optional[int]
+    _last_hash: Optional[bytes]
+    _schema: Optional[tuple]
+    _schema_saves: int
+    _save_on_destroy: bool
+
+    # -- Keys are written in insertion order by default; flipping this
+    # -- on (per subclass) sorts them on every save, which costs an
+    # -- O(N log N) pass in the stdlib fallback
+    canonical: bool = False
 
     def __new__(cls, name: str, *args, **kw):
 
         if not isinstance(name, str):
             raise ValueError("name must be a string")
-        
-        # Attempt to return the cached instance.
-        if name in _CACHE:
-            self = _CACHE[name]
+
+        # -- The backend/journal keywords are ours, not part of the
+        # -- stored data
+        backend = kw.pop("backend", None)
+        journal = kw.pop("journal", False)
+
+        # Attempt to return the cached instance. A single .get probe
+        # rather than `in` + subscript: with weak values the entry can
+        # be collected between the two steps, and .get also skips the
+        # exception machinery on the miss path.
+        self = _CACHE.get(name)
+        if self is not None:
             if args or kw:
-                self.update(dict(*args, **kw))
+                self._update_raw(*args, **kw)
+            _touch_cache(name, self)
             return self
-        except KeyError:
-            pass
 
         # Create and initialize the instance.
         self = object.__new__(cls)
-        self._init(name, *args, **kw)
+        self._init(name, *args, backend=backend, journal=journal, **kw)
 
         # Cache and return the instance.
         _CACHE[self._name] = self
+        _touch_cache(self._name, self)
         return self
 
 
-    def _init(self, name: str, *args, **kw) -> None:
+    def _init(
+        self,
+        name: str,
+        *args,
+        backend: Optional[str] = None,
+        journal: bool = False,
+        **kw,
+    ) -> None:
         """
         Called by __new__ when creating a new instance.
         """
 
+        backend = backend or DEFAULT_BACKEND
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"unknown backend: {backend!r} "
+                f"(available: {sorted(_BACKENDS)})"
+            )
+
         self._name = name
         self._data = {}
+        self._backend = backend
+        # -- resolved once: the property would otherwise build a fresh
+        # -- Path object on every access
+        suffix = _BACKENDS[backend][0]
+        self._path = _storage_dir() / f"{name}{suffix}"
         self._changed = False
+        self._journal = bool(journal)
+        self._log_fd = None
+        self._log_count = 0
+        self._fd = None
+        self._last_hash = None
+        self._schema = None
+        self._schema_saves = 0
+        self._save_on_destroy = False
         self.load()
-        self.update(dict(*args, **kw))
+        self._update_raw(*args, **kw)
 
     # --------------------------------------------------------------------
     # properties
@@ -121,7 +368,21 @@ class PersistentData(collections.abc.MutableMapping):
         
         :return: pathlib.Path
         """
-        return STORAGE_DIRECTORY / f"{self.name}.json"
+        return self._path
+
+    @property
+    def backend(self) -> str:
+        return self._backend
+
+    @property
+    def log_path(self) -> Path:
+        """
+        Returns the location of the delta-log sidecar used when the
+        scribble is journalled.
+
+        :return: pathlib.Path
+        """
+        return self.path.with_name(self.path.name + ".log")
 
     @property
     def save_on_destroy(self) -> bool:
@@ -141,42 +402,205 @@ class PersistentData(collections.abc.MutableMapping):
         dictionary.
         """
         if self.path.exists():
-            with open(self.path, "r") as f:
-                data = json.load(f)
-            self.update(data)
+            # -- read_bytes issues one sized read after fstat, and
+            # -- orjson parses the raw bytes without a python-level
+            # -- utf-8 decode pass
+            raw = self.path.read_bytes()
+            data = _BACKENDS[self._backend][2](raw)
+            # -- the snapshot came from our own save, so it goes into
+            # -- the backing dict directly: no key validation, no dirty
+            # -- marking and no re-journalling of existing state
+            self._data.update(data)
+
+        # -- Any deltas written since the last snapshot are replayed on
+        # -- top of it
+        if self._journal:
+            self._replay_log()
+
+        # -- We now mirror the persisted state exactly
+        self._changed = False
 
     def save(self) -> None:
         """
         Saves the ScribbleDictionary data to a persistent state
         """
-        # -- Ensure the location to save to exists, otherwise the
-        # -- write will fail
-        if not STORAGE_DIRECTORY.exists():
-            os.makedirs(STORAGE_DIRECTORY)
-
-        # -- Serialise to json - we wrap this in a try/except in case
-        # -- the data is not json serialisable.
+        # -- Nothing has mutated since the last load/save, so skip the
+        # -- whole serialise/write pipeline (the exists check keeps the
+        # -- first save of a brand new, empty scribble working)
+        if not self._changed and self.path.exists():
+            return
+
+        # -- Serialise the backing dict directly (rather than self) so
+        # -- the encoder can take its native-dict fast path instead of
+        # -- iterating the mapping interface key by key. Encoders signal
+        # -- unserialisable data with TypeError/ValueError; anything
+        # -- else (KeyboardInterrupt included) propagates untouched.
         try:
-            s = json.dumps(self, indent=2, sort_keys=True)
-
-        except BaseException:
-            raise Exception(
+            emit = None
+            if _CODEGEN and self._backend == "json":
+                emit = self._track_schema()
+            if emit is not None:
+                s = emit(self._data)
+            elif self._backend == "json":
+                s = _json_dumps(self._data, canonical=self.canonical)
+            else:
+                s = _BACKENDS[self._backend][1](self._data)
+
+        except (TypeError, ValueError) as e:
+            raise ValueError(
                 "Could not encode the data within the Scribble Dictionary "
-                "to JSON. Please ensure any stored data can be serialised "
-                "to JSON."
-            )
+                f"with the {self._backend!r} backend. Please ensure any "
+                "stored data can be serialised by it."
+            ) from e
+
+        # -- Mutations that restore the previous state leave the dirty
+        # -- flag set but serialise to the same bytes; a cheap digest
+        # -- comparison then spares the whole write+fsync
+        h = hashlib.blake2b(s, digest_size=16).digest()
+        if h == self._last_hash and self.path.exists():
+            if self._journal:
+                self._truncate_log()
+            self._changed = False
+            return
+
+        if self._backend == "json":
+            # -- Write the data out to a sibling temp file, flush it to
+            # -- disk, then atomically swap it into place. A crash
+            # -- mid-write can no longer leave a truncated/corrupt
+            # -- scribble behind - readers see either the old file or
+            # -- the new one
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, s)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, self.path)
+
+        else:
+            # -- Binary backends rewrite in place through one long-lived
+            # -- descriptor: no per-save open/close (path resolution and
+            # -- permission checks) and fdatasync skips the metadata
+            # -- flush that a full fsync forces
+            if self._fd is None:
+                self._fd = os.open(
+                    self.path,
+                    os.O_RDWR | os.O_CREAT,
+                    0o644,
+                )
+            os.pwrite(self._fd, s, 0)
+            os.ftruncate(self._fd, len(s))
+            getattr(os, "fdatasync", os.fsync)(self._fd)
+
+        self._last_hash = h
+
+        # -- The snapshot now contains every journalled delta, so the
+        # -- log can be dropped
+        if self._journal:
+            self._truncate_log()
+
+        self._changed = False
+
+    def _track_schema(self):
+        """
+        Counts consecutive saves with an unchanged key set, returning
+        the schema-specialised serialiser once the set has been stable
+        for SCHEMA_STABLE_SAVES saves (and None until then).
+        """
+        keys = tuple(self._data)
+        if keys == self._schema:
+            self._schema_saves += 1
+        else:
+            self._schema = keys
+            self._schema_saves = 0
 
-        # -- Write the data out
-        with open(self.path, "w") as f:
-            f.write(s)
+        if self._schema_saves >= SCHEMA_STABLE_SAVES:
+            return _specialised_dumps(keys, self.canonical)
+        return None
 
     # --------------------------------------------------------------------
-    # utils
+    # journalling
 
-    def _check_key(self, key: Any) -> None:
+    def _append_log(self, entry: dict) -> None:
+        """
+        Appends one delta entry to the log sidecar - an O(mutation size)
+        write instead of save()'s O(state size) rewrite - compacting
+        back into the snapshot once the log grows long.
+        """
+        if self._log_fd is None:
+            self._log_fd = os.open(
+                self.log_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o644,
+            )
 
-        if not isinstance(key, str):
-            raise KeyError("key must be a string")
+        # -- default=str mirrors the snapshot encoder: values the save
+        # -- pipeline accepts must not raise here at mutation time
+        if _orjson is not None:
+            line = _orjson.dumps(entry, default=str) + b"\n"
+        else:
+            line = json.dumps(entry, default=str).encode("utf-8") + b"\n"
+        os.write(self._log_fd, line)
+
+        self._log_count += 1
+        if self._log_count >= LOG_COMPACT_THRESHOLD:
+            self.save()
+
+    def _replay_log(self) -> None:
+        """
+        Applies the delta log, one line at a time, on top of the loaded
+        snapshot.
+        """
+        if not self.log_path.exists():
+            return
+
+        count = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = _json_loads(line)
+                op = entry["op"]
+                if op == "s":
+                    self._data[entry["k"]] = entry["v"]
+                elif op == "d":
+                    self._data.pop(entry["k"], None)
+                elif op == "u":
+                    self._data.update(entry["d"])
+                elif op == "c":
+                    self._data.clear()
+                count += 1
+        self._log_count = count
+
+    def _truncate_log(self) -> None:
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+        try:
+            os.remove(self.log_path)
+        except FileNotFoundError:
+            pass
+        self._log_count = 0
+
+    def save_async(self) -> None:
+        """
+        Schedules a save to happen shortly, coalescing bursts of calls
+        into a single write: callers mutating in a tight loop can invoke
+        this per mutation and pay for one file rewrite instead of one
+        per call. A flush is also guaranteed at interpreter exit.
+        """
+        global _flush_timer
+
+        with _flush_lock:
+            if _flush_timer is not None:
+                _flush_timer.cancel()
+            _flush_timer = threading.Timer(_FLUSH_DELAY, _flush_all)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+    # --------------------------------------------------------------------
+    # utils
 
     # --------------------------------------------------------------------
     # mapping interface
@@ -191,22 +615,77 @@ class PersistentData(collections.abc.MutableMapping):
         return self._data.items()
 
     def clear(self) -> None:
-        self._data.clear()
+        if self._data:
+            self._data.clear()
+            self._changed = True
+            if self._journal:
+                self._append_log({"op": "c"})
 
     def pop(self, key: str, default: Any = ...) -> Any:
 
-        self._check_key(key)
+        # -- inlined key check: the identity test covers exact str (the
+        # -- overwhelmingly common case) without a call or MRO walk, and
+        # -- str subclasses fall through to the full isinstance
+        if type(key) is not str and not isinstance(key, str):
+            raise KeyError("key must be a string")
         try:
-            return self._data.pop(key)
+            val = self._data.pop(key)
         except KeyError:
             if default is ...:
                 raise
             return default
+        self._changed = True
+        if self._journal:
+            self._append_log({"op": "d", "k": key})
+        return val
+
+    def _update_raw(self, *args, **kw) -> None:
+        """
+        update() for initializer arguments: mappings are validated and
+        fed straight into the backing dict rather than being copied into
+        a throwaway `dict(*args, **kw)` first, so construction-time data
+        is hashed and stored once. Keyword keys are strings by
+        construction and skip the check.
+        """
+        if not args and not kw:
+            return
+
+        args = [
+            arg if isinstance(arg, Mapping) else dict(arg)
+            for arg in args
+        ]
+        for arg in args:
+            if not all(map(str.__instancecheck__, arg)):
+                raise ValueError("all keys must be strings")
+
+        changed = False
+        for arg in args:
+            if arg:
+                self._data.update(arg)
+                changed = True
+        if kw:
+            self._data.update(kw)
+            changed = True
+
+        if changed:
+            self._changed = True
+            if self._journal:
+                merged = {}
+                for arg in args:
+                    merged.update(arg)
+                merged.update(kw)
+                self._append_log({"op": "u", "d": merged})
 
     def update(self, d: Mapping) -> None:
-        if any(not isinstance(key, str) for key in d):
+        # -- all(map(...)) keeps the key walk inside the C eval loop
+        # -- rather than resuming a generator frame per key
+        if not all(map(str.__instancecheck__, d)):
             raise ValueError("all keys must be strings")
-        self._data.update(d)
+        if d:
+            self._data.update(d)
+            self._changed = True
+            if self._journal:
+                self._append_log({"op": "u", "d": dict(d)})
 
 
     def __bool__(self) -> bool:
@@ -219,11 +698,19 @@ class PersistentData(collections.abc.MutableMapping):
         return self._data[key]
 
     def __setitem__(self, key: str, val: Any) -> None:
-        self._check_key(key)
+        # -- same inlined fast-path key check as pop
+        if type(key) is not str and not isinstance(key, str):
+            raise KeyError("key must be a string")
         self._data[key] = val
+        self._changed = True
+        if self._journal:
+            self._append_log({"op": "s", "k": key, "v": val})
 
     def __delitem__(self, key: str) -> None:
         del self._data[key]
+        self._changed = True
+        if self._journal:
+            self._append_log({"op": "d", "k": key})
         
     def __eq__(self, other: Any) -> bool:
         return self._data == other
@@ -238,28 +725,50 @@ class PersistentData(collections.abc.MutableMapping):
         return f"{type(self).__name__}({self._data})"
 
     def __del__(self) -> None:
-        if self.save_on_destroy:
+        # getattr guards: _init may not have completed if construction
+        # failed part way.
+        if getattr(self, "_save_on_destroy", False):
             self.save()
+        for fd in (getattr(self, "_log_fd", None), getattr(self, "_fd", None)):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
 
 
 # ----------------------------------------------------------------------------
 
 
-def get(name: str) -> ScribbleDictionary:
+def get(name: str) -> PersistentData:
     """
-    This will attempt to retrieve a Scribble Dictionary, first from
-    the cached instances and then from the STORAGE_DIRECTORY. If it
-    does not exist, an empty Scribble Dictionary will be created which
-    will be savable with the given name.
-    
+    This will attempt to retrieve a scribble, first from the cached
+    instances and then from the storage directory. If it does not
+    exist, an empty scribble will be created which will be savable
+    with the given name.
+
     :param name: Unique name to access a specific scribble
         dictionary.
     :type name: str
-    
-    :return: ScribbleDictionary
+
+    :return: PersistentData
     """
-    return ScribbleDictionary(name)
+    return PersistentData(name)
 
 
 def exists(name: str) -> bool:
-    return name in _CACHE or _CACHE[name].path.exists()
+    """
+    Returns whether a scribble with this name is live in the cache or
+    persisted on disk, without constructing (and therefore parsing) one
+    just to probe for it.
+    """
+    # -- a single .get probe: `name in _CACHE` can be true while the
+    # -- weak value is mid-collection
+    if _CACHE.get(name) is not None:
+        return True
+
+    storage = _storage_dir()
+    return any(
+        (storage / f"{name}{suffix}").exists()
+        for suffix, _, _ in _BACKENDS.values()
+    )